@@ -72,13 +72,17 @@ class GameMasterAgent(Agent):
 # ---------- LIVEKIT ENTRYPOINT ----------
 def prewarm(proc: JobProcess):
     proc.userdata["vad"] = silero.VAD.load()
+    proc.userdata["stt"] = deepgram.STT(model="nova-3")
+    proc.userdata["llm"] = google.LLM()
+    proc.userdata["tts"] = murf.TTS(voice="Matthew", style="Conversation")
 
 
 async def entrypoint(ctx: JobContext):
     session = AgentSession(
-        stt=deepgram.STT(model="nova-3"),
-        llm=google.LLM(),
-        tts=murf.TTS(voice="Matthew", style="Conversation"),
+        stt=ctx.proc.userdata["stt"],
+        llm=ctx.proc.userdata["llm"],
+        tts=ctx.proc.userdata["tts"],
+        # bound to the job's inference executor, so it can't be built in prewarm
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
         preemptive_generation=True,